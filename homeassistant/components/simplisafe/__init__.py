@@ -45,6 +45,7 @@ from simplipy.websocket import (
 )
 import voluptuous as vol
 
+from homeassistant.components.alarm_control_panel import FORMAT_NUMBER, FORMAT_TEXT
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_CODE,
@@ -382,6 +383,12 @@ class SimpliSafe:
         self.initial_event_to_use: dict[int, dict[str, Any]] = {}
         self.systems: dict[int, SystemV2 | SystemV3] = {}
 
+        # Options changes reload the entry (and recreate this object), so the code
+        # format only needs to be determined once:
+        self.code_format: str | None = None
+        if code := entry.options.get(CONF_CODE):
+            self.code_format = FORMAT_NUMBER if code.isdigit() else FORMAT_TEXT
+
         # This will get filled in by async_init:
         self.coordinator: DataUpdateCoordinator | None = None
 
@@ -607,14 +614,14 @@ class SimpliSafeEntity(CoordinatorEntity):
         self._online = True
         self._simplisafe = simplisafe
         self._system = system
-        self._websocket_events_to_listen_for = [
+        self._websocket_events_to_listen_for = {
             EVENT_CONNECTION_LOST,
             EVENT_CONNECTION_RESTORED,
             EVENT_POWER_OUTAGE,
             EVENT_POWER_RESTORED,
-        ]
+        }
         if additional_websocket_events:
-            self._websocket_events_to_listen_for += additional_websocket_events
+            self._websocket_events_to_listen_for.update(additional_websocket_events)
 
     @property
     def available(self) -> bool:
@@ -1,7 +1,9 @@
 """Support for SimpliSafe alarm control panels."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, cast
 
 from simplipy.errors import SimplipyError
 from simplipy.system import SystemStates
@@ -22,11 +24,7 @@ from simplipy.websocket import (
     WebsocketEvent,
 )
 
-from homeassistant.components.alarm_control_panel import (
-    FORMAT_NUMBER,
-    FORMAT_TEXT,
-    AlarmControlPanelEntity,
-)
+from homeassistant.components.alarm_control_panel import AlarmControlPanelEntity
 from homeassistant.components.alarm_control_panel.const import (
     SUPPORT_ALARM_ARM_AWAY,
     SUPPORT_ALARM_ARM_HOME,
@@ -88,20 +86,43 @@ STATE_MAP_FROM_WEBSOCKET_EVENT = {
     EVENT_HOME_EXIT_DELAY: STATE_ALARM_ARMING,
 }
 
-WEBSOCKET_EVENTS_TO_LISTEN_FOR = (
-    EVENT_ALARM_CANCELED,
-    EVENT_ALARM_TRIGGERED,
-    EVENT_ARMED_AWAY,
-    EVENT_ARMED_AWAY_BY_KEYPAD,
-    EVENT_ARMED_AWAY_BY_REMOTE,
-    EVENT_ARMED_HOME,
-    EVENT_AWAY_EXIT_DELAY_BY_KEYPAD,
-    EVENT_AWAY_EXIT_DELAY_BY_REMOTE,
-    EVENT_DISARMED_BY_MASTER_PIN,
-    EVENT_DISARMED_BY_REMOTE,
-    EVENT_HOME_EXIT_DELAY,
+# SystemStates isn't an IntEnum (and its values aren't contiguous), so the maps can't
+# become index-based tables; bind their lookups once to skip the attribute access.
+# These must stay .get() (not __getitem__): the base entity also forwards connection
+# and power events, which aren't in the websocket map:
+_REST_MAP_GET = STATE_MAP_FROM_REST_API.get
+_WS_MAP_GET = STATE_MAP_FROM_WEBSOCKET_EVENT.get
+
+# Every websocket event the alarm cares about is one it can map to a state:
+WEBSOCKET_EVENTS_TO_LISTEN_FOR = frozenset(STATE_MAP_FROM_WEBSOCKET_EVENT)
+
+# The order of these must match the values gathered in async_update_from_rest_api:
+REST_API_ATTRS_V3 = (
+    ATTR_ALARM_DURATION,
+    ATTR_ALARM_VOLUME,
+    ATTR_BATTERY_BACKUP_POWER_LEVEL,
+    ATTR_CHIME_VOLUME,
+    ATTR_ENTRY_DELAY_AWAY,
+    ATTR_ENTRY_DELAY_HOME,
+    ATTR_EXIT_DELAY_AWAY,
+    ATTR_EXIT_DELAY_HOME,
+    ATTR_GSM_STRENGTH,
+    ATTR_LIGHT,
+    ATTR_RF_JAMMING,
+    ATTR_VOICE_PROMPT_VOLUME,
+    ATTR_WALL_POWER_LEVEL,
+    ATTR_WIFI_STRENGTH,
 )
 
+_LOWERCASE_ENUM_NAMES: dict[Enum, str] = {}
+
+
+def _lowercase_name(value: Enum) -> str:
+    """Return the lowercased name of an enum member (cached)."""
+    if (name := _LOWERCASE_ENUM_NAMES.get(value)) is None:
+        name = _LOWERCASE_ENUM_NAMES[value] = value.name.lower()
+    return name
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -109,7 +130,7 @@ async def async_setup_entry(
     """Set up a SimpliSafe alarm control panel based on a config entry."""
     simplisafe = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        [SimpliSafeAlarm(simplisafe, system) for system in simplisafe.systems.values()],
+        (SimpliSafeAlarm(simplisafe, system) for system in simplisafe.systems.values()),
         True,
     )
 
@@ -125,23 +146,20 @@ class SimpliSafeAlarm(SimpliSafeEntity, AlarmControlPanelEntity):
             additional_websocket_events=WEBSOCKET_EVENTS_TO_LISTEN_FOR,
         )
 
-        if code := self._simplisafe.entry.options.get(CONF_CODE):
-            if code.isdigit():
-                self._attr_code_format = FORMAT_NUMBER
-            else:
-                self._attr_code_format = FORMAT_TEXT
+        self._attr_code_format = simplisafe.code_format
         self._attr_supported_features = SUPPORT_ALARM_ARM_HOME | SUPPORT_ALARM_ARM_AWAY
         self._last_event = None
+        self._last_rest_api_attr_values: tuple[Any, ...] | None = None
 
         self._set_state_from_system_data()
 
     @callback
     def _is_code_valid(self, code: str | None, state: str) -> bool:
         """Validate that a code matches the required one."""
-        if not self._simplisafe.entry.options.get(CONF_CODE):
+        if not (required_code := self._simplisafe.entry.options.get(CONF_CODE)):
             return True
 
-        if not code or code != self._simplisafe.entry.options[CONF_CODE]:
+        if not code or code != required_code:
             LOGGER.warning(
                 "Incorrect alarm code entered (target state: %s): %s", state, code
             )
@@ -154,80 +172,91 @@ class SimpliSafeAlarm(SimpliSafeEntity, AlarmControlPanelEntity):
         """Set the state based on the latest REST API data."""
         if self._system.alarm_going_off:
             self._attr_state = STATE_ALARM_TRIGGERED
-        elif state := STATE_MAP_FROM_REST_API.get(self._system.state):
+        elif state := _REST_MAP_GET(self._system.state):
             self._attr_state = state
         else:
             LOGGER.error("Unknown system state (REST API): %s", self._system.state)
             self._attr_state = None
 
-    async def async_alarm_disarm(self, code: str | None = None) -> None:
-        """Send disarm command."""
-        if not self._is_code_valid(code, STATE_ALARM_DISARMED):
+    async def _async_run_command(
+        self,
+        command: Callable[[], Awaitable[None]],
+        target_state: str,
+        new_state: str,
+        error_message: str,
+        code: str | None,
+    ) -> None:
+        """Validate the code, run a system command, and update the state."""
+        if not self._is_code_valid(code, target_state):
             return
 
         try:
-            await self._system.async_set_off()
+            await command()
         except SimplipyError as err:
-            LOGGER.error('Error while disarming "%s": %s', self._system.system_id, err)
+            LOGGER.error(error_message, self._system.system_id, err)
             return
 
-        self._attr_state = STATE_ALARM_DISARMED
+        self._attr_state = new_state
         self.async_write_ha_state()
 
+    async def async_alarm_disarm(self, code: str | None = None) -> None:
+        """Send disarm command."""
+        await self._async_run_command(
+            self._system.async_set_off,
+            STATE_ALARM_DISARMED,
+            STATE_ALARM_DISARMED,
+            'Error while disarming "%s": %s',
+            code,
+        )
+
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
-        if not self._is_code_valid(code, STATE_ALARM_ARMED_HOME):
-            return
-
-        try:
-            await self._system.async_set_home()
-        except SimplipyError as err:
-            LOGGER.error(
-                'Error while arming "%s" (home): %s', self._system.system_id, err
-            )
-            return
-
-        self._attr_state = STATE_ALARM_ARMED_HOME
-        self.async_write_ha_state()
+        await self._async_run_command(
+            self._system.async_set_home,
+            STATE_ALARM_ARMED_HOME,
+            STATE_ALARM_ARMED_HOME,
+            'Error while arming "%s" (home): %s',
+            code,
+        )
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
-        if not self._is_code_valid(code, STATE_ALARM_ARMED_AWAY):
-            return
-
-        try:
-            await self._system.async_set_away()
-        except SimplipyError as err:
-            LOGGER.error(
-                'Error while arming "%s" (away): %s', self._system.system_id, err
-            )
-            return
-
-        self._attr_state = STATE_ALARM_ARMING
-        self.async_write_ha_state()
+        await self._async_run_command(
+            self._system.async_set_away,
+            STATE_ALARM_ARMED_AWAY,
+            STATE_ALARM_ARMING,
+            'Error while arming "%s" (away): %s',
+            code,
+        )
 
     @callback
     def async_update_from_rest_api(self) -> None:
         """Update the entity with the provided REST API data."""
-        if isinstance(self._system, SystemV3):
-            self._attr_extra_state_attributes.update(
-                {
-                    ATTR_ALARM_DURATION: self._system.alarm_duration,
-                    ATTR_ALARM_VOLUME: self._system.alarm_volume.name.lower(),
-                    ATTR_BATTERY_BACKUP_POWER_LEVEL: self._system.battery_backup_power_level,
-                    ATTR_CHIME_VOLUME: self._system.chime_volume.name.lower(),
-                    ATTR_ENTRY_DELAY_AWAY: self._system.entry_delay_away,
-                    ATTR_ENTRY_DELAY_HOME: self._system.entry_delay_home,
-                    ATTR_EXIT_DELAY_AWAY: self._system.exit_delay_away,
-                    ATTR_EXIT_DELAY_HOME: self._system.exit_delay_home,
-                    ATTR_GSM_STRENGTH: self._system.gsm_strength,
-                    ATTR_LIGHT: self._system.light,
-                    ATTR_RF_JAMMING: self._system.rf_jamming,
-                    ATTR_VOICE_PROMPT_VOLUME: self._system.voice_prompt_volume.name.lower(),
-                    ATTR_WALL_POWER_LEVEL: self._system.wall_power_level,
-                    ATTR_WIFI_STRENGTH: self._system.wifi_strength,
-                }
+        system = self._system
+        if isinstance(system, SystemV3):
+            rest_api_attr_values = (
+                system.alarm_duration,
+                _lowercase_name(system.alarm_volume),
+                system.battery_backup_power_level,
+                _lowercase_name(system.chime_volume),
+                system.entry_delay_away,
+                system.entry_delay_home,
+                system.exit_delay_away,
+                system.exit_delay_home,
+                system.gsm_strength,
+                system.light,
+                system.rf_jamming,
+                _lowercase_name(system.voice_prompt_volume),
+                system.wall_power_level,
+                system.wifi_strength,
             )
+            # Most refreshes don't change these values, so only touch the attributes
+            # when something actually differs from what was last published:
+            if rest_api_attr_values != self._last_rest_api_attr_values:
+                self._last_rest_api_attr_values = rest_api_attr_values
+                self._attr_extra_state_attributes.update(
+                    zip(REST_API_ATTRS_V3, rest_api_attr_values)
+                )
 
         self._set_state_from_system_data()
 
@@ -235,6 +264,4 @@ class SimpliSafeAlarm(SimpliSafeEntity, AlarmControlPanelEntity):
     def async_update_from_websocket_event(self, event: WebsocketEvent) -> None:
         """Update the entity when new data comes from the websocket."""
         self._attr_changed_by = event.changed_by
-        if TYPE_CHECKING:
-            assert event.event_type
-        self._attr_state = STATE_MAP_FROM_WEBSOCKET_EVENT.get(event.event_type)
+        self._attr_state = _WS_MAP_GET(cast(str, event.event_type))
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from velbusaio.channels import Channel as VelbusChannel
 from velbusaio.controller import Velbus
@@ -31,7 +32,7 @@ CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: vol.Schema({vol.Required(CONF_PORT): cv.string})}, extra=vol.ALLOW_EXTRA
 )
 
-PLATFORMS = ["switch", "sensor", "binary_sensor", "cover", "climate", "light"]
+PLATFORMS = ("switch", "sensor", "binary_sensor", "cover", "climate", "light")
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -69,13 +70,68 @@ def _migrate_device_identifiers(hass: HomeAssistant, entry_id: str) -> None:
         dev_reg, entry_id
     )
     for device in devices:
-        old_identifier = list(next(iter(device.identifiers)))
-        if len(old_identifier) > 2:
-            new_identifier = {(old_identifier.pop(0), old_identifier.pop(0))}
-            _LOGGER.debug(
-                "migrate identifier '%s' to '%s'", device.identifiers, new_identifier
-            )
-            dev_reg.async_update_device(device.id, new_identifiers=new_identifier)
+        old_identifier = next(iter(device.identifiers))
+        if len(old_identifier) <= 2:
+            continue
+        new_identifier = {(old_identifier[0], old_identifier[1])}
+        _LOGGER.debug(
+            "migrate identifier '%s' to '%s'", device.identifiers, new_identifier
+        )
+        dev_reg.async_update_device(device.id, new_identifiers=new_identifier)
+
+
+def _get_device_info(
+    device_infos: dict[int, DeviceInfo], channel: VelbusChannel
+) -> DeviceInfo:
+    """Return the (shared) device info of a channel's module."""
+    address = channel.get_module_address()
+    if (device_info := device_infos.get(address)) is None:
+        device_info = device_infos[address] = DeviceInfo(
+            identifiers={
+                (DOMAIN, str(address)),
+            },
+            manufacturer="Velleman",
+            model=channel.get_module_type_name(),
+            name=channel.get_full_name(),
+            sw_version=channel.get_module_sw_version(),
+        )
+    return device_info
+
+
+class _VelbusServices:
+    """Handle the Velbus services for all loaded config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._data: dict[str, Any] = hass.data[DOMAIN]
+
+    def resolve_controller(self, interface: str) -> Velbus:
+        """Return the controller of the config entry using an interface."""
+        try:
+            entry_id = self._data["_by_port"][interface]
+        except KeyError as err:
+            raise vol.Invalid(
+                "The interface provided is not defined as a port in a Velbus integration"
+            ) from err
+        controller: Velbus = self._data[entry_id]["cntrl"]
+        return controller
+
+    async def scan(self, call: ServiceCall) -> None:
+        """Handle Scan service call."""
+        await call.data[CONF_INTERFACE].scan()
+
+    async def sync_clock(self, call: ServiceCall) -> None:
+        """Handle Sync Clock service call."""
+        await call.data[CONF_INTERFACE].sync_clock()
+
+    async def set_memo_text(self, call: ServiceCall) -> None:
+        """Handle Memo Text service call."""
+        memo_text = call.data[CONF_MEMO_TEXT]
+        memo_text.hass = self._hass
+        await call.data[CONF_INTERFACE].get_module(
+            call.data[CONF_ADDRESS]
+        ).set_memo_text(memo_text.async_render())
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -86,62 +142,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data[CONF_PORT],
         cache_dir=hass.config.path(".storage/velbuscache/"),
     )
-    hass.data[DOMAIN][entry.entry_id] = {}
-    hass.data[DOMAIN][entry.entry_id]["cntrl"] = controller
-    hass.data[DOMAIN][entry.entry_id]["tsk"] = hass.async_create_task(
+    entry_data: dict[str, Any] = {}
+    hass.data[DOMAIN][entry.entry_id] = entry_data
+    entry_data["cntrl"] = controller
+    # All channels of a module share the same device info; key it by module address
+    entry_data["device_info"] = {}
+    entry_data["tsk"] = hass.async_create_task(
         velbus_connect_task(controller, hass, entry.entry_id)
     )
+    hass.data[DOMAIN].setdefault("_by_port", {})[entry.data[CONF_PORT]] = entry.entry_id
 
     _migrate_device_identifiers(hass, entry.entry_id)
 
     hass.config_entries.async_setup_platforms(entry, PLATFORMS)
 
-    if hass.services.has_service(DOMAIN, SERVICE_SCAN):
+    if hass.data[DOMAIN].get("_services_registered"):
         return True
+    hass.data[DOMAIN]["_services_registered"] = True
 
-    def check_entry_id(interface: str) -> str:
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if "port" in entry.data and entry.data["port"] == interface:
-                return entry.entry_id
-        raise vol.Invalid(
-            "The interface provided is not defined as a port in a Velbus integration"
-        )
-
-    async def scan(call: ServiceCall) -> None:
-        await hass.data[DOMAIN][call.data[CONF_INTERFACE]]["cntrl"].scan()
+    services = _VelbusServices(hass)
+    interface_validator = vol.All(cv.string, services.resolve_controller)
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SCAN,
-        scan,
-        vol.Schema({vol.Required(CONF_INTERFACE): vol.All(cv.string, check_entry_id)}),
+        services.scan,
+        vol.Schema({vol.Required(CONF_INTERFACE): interface_validator}),
     )
-
-    async def syn_clock(call: ServiceCall) -> None:
-        await hass.data[DOMAIN][call.data[CONF_INTERFACE]]["cntrl"].sync_clock()
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_SYNC,
-        syn_clock,
-        vol.Schema({vol.Required(CONF_INTERFACE): vol.All(cv.string, check_entry_id)}),
+        services.sync_clock,
+        vol.Schema({vol.Required(CONF_INTERFACE): interface_validator}),
     )
-
-    async def set_memo_text(call: ServiceCall) -> None:
-        """Handle Memo Text service call."""
-        memo_text = call.data[CONF_MEMO_TEXT]
-        memo_text.hass = hass
-        await hass.data[DOMAIN][call.data[CONF_INTERFACE]]["cntrl"].get_module(
-            call.data[CONF_ADDRESS]
-        ).set_memo_text(memo_text.async_render())
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_MEMO_TEXT,
-        set_memo_text,
+        services.set_memo_text,
         vol.Schema(
             {
-                vol.Required(CONF_INTERFACE): vol.All(cv.string, check_entry_id),
+                vol.Required(CONF_INTERFACE): interface_validator,
                 vol.Required(CONF_ADDRESS): vol.All(
                     vol.Coerce(int), vol.Range(min=0, max=255)
                 ),
@@ -156,9 +196,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Remove the velbus connection."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    await hass.data[DOMAIN][entry.entry_id]["cntrl"].stop()
-    hass.data[DOMAIN].pop(entry.entry_id)
-    if not hass.data[DOMAIN]:
+    entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+    await entry_data["cntrl"].stop()
+    by_port = hass.data[DOMAIN]["_by_port"]
+    by_port.pop(entry.data[CONF_PORT])
+    if not by_port:
         hass.data.pop(DOMAIN)
         hass.services.async_remove(DOMAIN, SERVICE_SCAN)
         hass.services.async_remove(DOMAIN, SERVICE_SYNC)
@@ -169,43 +211,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class VelbusEntity(Entity):
     """Representation of a Velbus entity."""
 
-    def __init__(self, channel: VelbusChannel) -> None:
+    _attr_should_poll = False
+
+    def __init__(
+        self, channel: VelbusChannel, device_infos: dict[int, DeviceInfo]
+    ) -> None:
         """Initialize a Velbus entity."""
         self._channel = channel
 
-    @property
-    def unique_id(self) -> str:
-        """Get unique ID."""
-        if (serial := self._channel.get_module_serial()) == "":
-            serial = str(self._channel.get_module_address())
-        return f"{serial}-{self._channel.get_channel_number()}"
+        # The channel's module metadata doesn't change, so compute these only once:
+        if (serial := channel.get_module_serial()) == "":
+            serial = str(channel.get_module_address())
+        self._attr_unique_id = f"{serial}-{channel.get_channel_number()}"
+        self._attr_device_info = _get_device_info(device_infos, channel)
 
     @property
     def name(self) -> str:
         """Return the display name of this entity."""
         return self._channel.get_name()
 
-    @property
-    def should_poll(self) -> bool:
-        """Disable polling."""
-        return False
-
     async def async_added_to_hass(self) -> None:
         """Add listener for state changes."""
         self._channel.on_status_update(self._on_update)
 
     async def _on_update(self) -> None:
         self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, str(self._channel.get_module_address())),
-            },
-            manufacturer="Velleman",
-            model=self._channel.get_module_type_name(),
-            name=self._channel.get_full_name(),
-            sw_version=self._channel.get_module_sw_version(),
-        )
@@ -15,6 +15,7 @@ from homeassistant.components.cover import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VelbusEntity
@@ -29,9 +30,10 @@ async def async_setup_entry(
     """Set up Velbus switch based on config_entry."""
     await hass.data[DOMAIN][entry.entry_id]["tsk"]
     cntrl = hass.data[DOMAIN][entry.entry_id]["cntrl"]
+    device_infos = hass.data[DOMAIN][entry.entry_id]["device_info"]
     entities = []
     for channel in cntrl.get_all("cover"):
-        entities.append(VelbusCover(channel))
+        entities.append(VelbusCover(channel, device_infos))
     async_add_entities(entities)
 
 
@@ -40,9 +42,11 @@ class VelbusCover(VelbusEntity, CoverEntity):
 
     _channel: VelbusBlind
 
-    def __init__(self, channel: VelbusBlind) -> None:
+    def __init__(
+        self, channel: VelbusBlind, device_infos: dict[int, DeviceInfo]
+    ) -> None:
         """Initialize the dimmer."""
-        super().__init__(channel)
+        super().__init__(channel, device_infos)
         if self._channel.support_position():
             self._attr_supported_features = (
                 SUPPORT_OPEN | SUPPORT_CLOSE | SUPPORT_STOP | SUPPORT_SET_POSITION
@@ -22,7 +22,7 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VelbusEntity
@@ -37,11 +37,12 @@ async def async_setup_entry(
     """Set up Velbus switch based on config_entry."""
     await hass.data[DOMAIN][entry.entry_id]["tsk"]
     cntrl = hass.data[DOMAIN][entry.entry_id]["cntrl"]
+    device_infos = hass.data[DOMAIN][entry.entry_id]["device_info"]
     entities: list[Entity] = []
     for channel in cntrl.get_all("light"):
-        entities.append(VelbusLight(channel))
+        entities.append(VelbusLight(channel, device_infos))
     for channel in cntrl.get_all("led"):
-        entities.append(VelbusButtonLight(channel))
+        entities.append(VelbusButtonLight(channel, device_infos))
     async_add_entities(entities)
 
 
@@ -51,9 +52,11 @@ class VelbusLight(VelbusEntity, LightEntity):
     _channel: VelbusDimmer
     _attr_supported_feature = SUPPORT_BRIGHTNESS | SUPPORT_TRANSITION
 
-    def __init__(self, channel: VelbusDimmer) -> None:
+    def __init__(
+        self, channel: VelbusDimmer, device_infos: dict[int, DeviceInfo]
+    ) -> None:
         """Initialize the dimmer."""
-        super().__init__(channel)
+        super().__init__(channel, device_infos)
         self._attr_name = self._channel.get_name()
 
     @property
@@ -103,9 +106,11 @@ class VelbusButtonLight(VelbusEntity, LightEntity):
     _attr_entity_registry_enabled_default = False
     _attr_supported_feature = SUPPORT_FLASH
 
-    def __init__(self, channel: VelbusChannel) -> None:
+    def __init__(
+        self, channel: VelbusChannel, device_infos: dict[int, DeviceInfo]
+    ) -> None:
         """Initialize the button light (led)."""
-        super().__init__(channel)
+        super().__init__(channel, device_infos)
         self._attr_name = f"LED {self._channel.get_name()}"
 
     @property
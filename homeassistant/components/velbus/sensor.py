@@ -15,6 +15,7 @@ from homeassistant.const import (
     DEVICE_CLASS_TEMPERATURE,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VelbusEntity
@@ -29,11 +30,12 @@ async def async_setup_entry(
     """Set up Velbus switch based on config_entry."""
     await hass.data[DOMAIN][entry.entry_id]["tsk"]
     cntrl = hass.data[DOMAIN][entry.entry_id]["cntrl"]
+    device_infos = hass.data[DOMAIN][entry.entry_id]["device_info"]
     entities = []
     for channel in cntrl.get_all("sensor"):
-        entities.append(VelbusSensor(channel))
+        entities.append(VelbusSensor(channel, device_infos))
         if channel.is_counter_channel():
-            entities.append(VelbusSensor(channel, True))
+            entities.append(VelbusSensor(channel, device_infos, True))
     async_add_entities(entities)
 
 
@@ -45,19 +47,14 @@ class VelbusSensor(VelbusEntity, SensorEntity):
     def __init__(
         self,
         channel: ButtonCounter | Temperature | LightSensor | SensorNumber,
+        device_infos: dict[int, DeviceInfo],
         counter: bool = False,
     ) -> None:
         """Initialize a sensor Velbus entity."""
-        super().__init__(channel)
+        super().__init__(channel, device_infos)
         self._is_counter: bool = counter
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for counter sensors."""
-        unique_id = super().unique_id
-        if self._is_counter:
-            unique_id = f"{unique_id}-counter"
-        return unique_id
+        if counter:
+            self._attr_unique_id = f"{self._attr_unique_id}-counter"
 
     @property
     def name(self) -> str:
@@ -20,9 +20,10 @@ async def async_setup_entry(
     """Set up Velbus switch based on config_entry."""
     await hass.data[DOMAIN][entry.entry_id]["tsk"]
     cntrl = hass.data[DOMAIN][entry.entry_id]["cntrl"]
+    device_infos = hass.data[DOMAIN][entry.entry_id]["device_info"]
     entities = []
     for channel in cntrl.get_all("switch"):
-        entities.append(VelbusSwitch(channel))
+        entities.append(VelbusSwitch(channel, device_infos))
     async_add_entities(entities)
 
 
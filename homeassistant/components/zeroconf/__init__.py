@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from contextlib import suppress
+from dataclasses import dataclass
 import fnmatch
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from functools import lru_cache
+from ipaddress import IPv4Address, IPv6Address
 import logging
+import re
 import socket
 import sys
+import time
 from typing import Any, Final, TypedDict, cast
 
 import voluptuous as vol
@@ -39,17 +44,24 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "zeroconf"
 
 ZEROCONF_TYPE = "_home-assistant._tcp.local."
-HOMEKIT_TYPES = [
-    "_hap._tcp.local.",
-    # Thread based devices
-    "_hap._udp.local.",
-]
+HOMEKIT_TYPES = frozenset(
+    {
+        "_hap._tcp.local.",
+        # Thread based devices
+        "_hap._udp.local.",
+    }
+)
+# Types that are browsed even if no integration asks for them
+_EXTRA_TYPES = frozenset({ZEROCONF_TYPE}) | HOMEKIT_TYPES
 
 CONF_DEFAULT_INTERFACE = "default_interface"
 CONF_IPV6 = "ipv6"
 DEFAULT_DEFAULT_INTERFACE = True
 DEFAULT_IPV6 = True
 
+# The platform can't change at runtime, see _async_zc_has_functional_dual_stack
+_HAS_DUAL_STACK: Final = not sys.platform.startswith(("freebsd", "darwin"))
+
 HOMEKIT_PAIRED_STATUS_FLAG = "sf"
 HOMEKIT_MODEL = "md"
 
@@ -60,6 +72,24 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# Identical discoveries of a service are only dispatched to a domain
+# once within this many seconds
+DISPATCH_CACHE_TTL = 60
+DISPATCH_CACHE_SIZE = 1024
+
+# Limits on the service updates being resolved at the same time and on the
+# ones waiting to be resolved; updates beyond the latter are dropped
+MAX_CONCURRENT_SERVICE_UPDATES = 8
+MAX_OUTSTANDING_SERVICE_UPDATES = 2048
+
+# Packed prefix of the IPv4 link local network (169.254.0.0/16)
+IPV4_LINK_LOCAL_PREFIX = b"\xa9\xfe"
+
+# Packed special addresses that are never announced
+IPV4_UNSPECIFIED = bytes(4)
+IPV6_UNSPECIFIED = bytes(16)
+IPV6_LOOPBACK = bytes(15) + b"\x01"
+
 # Attributes for ZeroconfServiceInfo
 ATTR_HOST: Final = "host"
 ATTR_HOSTNAME: Final = "hostname"
@@ -71,6 +101,10 @@ ATTR_TYPE: Final = "type"
 # Attributes for ZeroconfServiceInfo[ATTR_PROPERTIES]
 ATTR_PROPERTIES_ID: Final = "id"
 
+# Matcher keys that are matched against the discovery info, in the order
+# they are checked
+MATCHER_FIELDS = ("macaddress", "name", "manufacturer", "model")
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -89,6 +123,58 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+@dataclass
+class _FieldPatterns:
+    """The unique compiled patterns the matchers of a service type use for a field."""
+
+    field: str
+    # Bits of the matchers that have a pattern for this field
+    mask: int
+    # Each unique pattern with the bits of the matchers using it
+    patterns: list[tuple[re.Pattern[str], int]]
+
+
+@dataclass
+class _ZeroconfMatchers:
+    """The matchers of a service type grouped by field.
+
+    Matcher i is represented by bit i of the masks, so every unique pattern
+    only has to be evaluated once per update, however many matchers share it.
+    """
+
+    domains: list[str]
+    fields: list[_FieldPatterns]
+
+
+def _compile_matchers(matchers: list[dict[str, str]]) -> _ZeroconfMatchers:
+    """Compile and group the fnmatch patterns of the matchers from the manifests."""
+    fields: list[_FieldPatterns] = []
+    for field in MATCHER_FIELDS:
+        field_mask = 0
+        pattern_masks: dict[str, int] = {}
+        for index, matcher in enumerate(matchers):
+            if field in matcher:
+                bit = 1 << index
+                field_mask |= bit
+                pattern_masks[matcher[field]] = (
+                    pattern_masks.get(matcher[field], 0) | bit
+                )
+        if field_mask:
+            fields.append(
+                _FieldPatterns(
+                    field,
+                    field_mask,
+                    [
+                        (re.compile(fnmatch.translate(pattern)), mask)
+                        for pattern, mask in pattern_masks.items()
+                    ],
+                )
+            )
+    return _ZeroconfMatchers([matcher["domain"] for matcher in matchers], fields)
+
+
+# This stays a plain dict: config flows (e.g. vizio, plugwise) add their own keys
+# to the discovery info and use dict methods such as .get() on it.
 class ZeroconfServiceInfo(TypedDict):
     """Prepared info from mDNS entries."""
 
@@ -139,49 +225,53 @@ def _async_zc_has_functional_dual_stack() -> bool:
 
     Zeroconf only supports a single listen socket at this time.
     """
-    return not sys.platform.startswith("freebsd") and not sys.platform.startswith(
-        "darwin"
-    )
+    return _HAS_DUAL_STACK
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Zeroconf and make Home Assistant discoverable."""
     zc_args: dict = {"ip_version": IPVersion.V4Only}
 
-    adapters = await network.async_get_adapters(hass)
+    adapters, zeroconf_types, homekit_models = await asyncio.gather(
+        network.async_get_adapters(hass),
+        async_get_zeroconf(hass),
+        async_get_homekit(hass),
+    )
+
+    has_ipv4 = has_ipv6 = False
+    for adapter in adapters:
+        if adapter["enabled"]:
+            has_ipv4 |= bool(adapter["ipv4"])
+            has_ipv6 |= bool(adapter["ipv6"])
 
     ipv6 = False
     if _async_zc_has_functional_dual_stack():
-        if any(adapter["enabled"] and adapter["ipv6"] for adapter in adapters):
+        if has_ipv6:
             ipv6 = True
             zc_args["ip_version"] = IPVersion.All
-    elif not any(adapter["enabled"] and adapter["ipv4"] for adapter in adapters):
+    elif not has_ipv4:
         zc_args["ip_version"] = IPVersion.V6Only
         ipv6 = True
 
     if not ipv6 and network.async_only_default_interface_enabled(adapters):
         zc_args["interfaces"] = InterfaceChoice.Default
     else:
+        ip_version = zc_args["ip_version"]
+        excluded_types: tuple[type, ...] = ()
+        if ip_version == IPVersion.V4Only:
+            excluded_types = (IPv6Address,)
+        elif ip_version == IPVersion.V6Only:
+            excluded_types = (IPv4Address,)
         zc_args["interfaces"] = [
             str(source_ip)
             for source_ip in await network.async_get_enabled_source_ips(hass)
             if not source_ip.is_loopback
+            and not isinstance(source_ip, excluded_types)
             and not (isinstance(source_ip, IPv6Address) and source_ip.is_global)
-            and not (
-                isinstance(source_ip, IPv6Address)
-                and zc_args["ip_version"] == IPVersion.V4Only
-            )
-            and not (
-                isinstance(source_ip, IPv4Address)
-                and zc_args["ip_version"] == IPVersion.V6Only
-            )
         ]
 
     aio_zc = await _async_get_instance(hass, **zc_args)
     zeroconf = cast(HaZeroconf, aio_zc.zeroconf)
-    zeroconf_types, homekit_models = await asyncio.gather(
-        async_get_zeroconf(hass), async_get_homekit(hass)
-    )
     discovery = ZeroconfDiscovery(hass, zeroconf, zeroconf_types, homekit_models, ipv6)
     await discovery.async_setup()
 
@@ -210,24 +300,41 @@ def _get_announced_addresses(
 
     If first_ip is not None, it will be the first address in the list.
     """
-    addresses = {
-        addr.packed
-        for addr in [
-            ip_address(ip["address"])
-            for adapter in adapters
-            if adapter["enabled"]
-            for ip in cast(list, adapter["ipv6"]) + cast(list, adapter["ipv4"])
-        ]
-        if not (addr.is_unspecified or addr.is_loopback)
-    }
+    address_list: list[bytes] = []
+    seen: set[bytes] = set()
+
+    def _add_address(packed: bytes) -> None:
+        if packed in seen or _is_unspecified_or_loopback(packed):
+            return
+        seen.add(packed)
+        address_list.append(packed)
+
     if first_ip:
-        address_list = [first_ip]
-        address_list.extend(addresses - set({first_ip}))
-    else:
-        address_list = list(addresses)
+        address_list.append(first_ip)
+        seen.add(first_ip)
+    for adapter in adapters:
+        if not adapter["enabled"]:
+            continue
+        for ipv6 in adapter["ipv6"]:
+            _add_address(_pack_address(socket.AF_INET6, ipv6["address"]))
+        for ipv4 in adapter["ipv4"]:
+            _add_address(_pack_address(socket.AF_INET, ipv4["address"]))
     return address_list
 
 
+@lru_cache(maxsize=256)
+def _pack_address(family: int, address: str) -> bytes:
+    """Return the packed form of an IP address (cached)."""
+    return socket.inet_pton(family, address)
+
+
+def _is_unspecified_or_loopback(packed: bytes) -> bool:
+    """Return if a packed IPv4 or IPv6 address is unspecified or loopback."""
+    if len(packed) == 4:
+        return packed == IPV4_UNSPECIFIED or packed[0] == 127
+    return packed in (IPV6_UNSPECIFIED, IPV6_LOOPBACK)
+
+
 async def _async_register_hass_zc_service(
     hass: HomeAssistant, aio_zc: HaAsyncZeroconf, uuid: str
 ) -> None:
@@ -236,28 +343,28 @@ async def _async_register_hass_zc_service(
         hass.config.location_name or "Home"
     )
 
+    # Get instance URL's
+    external_url = internal_url = ""
+    with suppress(NoURLAvailableError):
+        external_url = get_url(hass, allow_internal=False)
+
+    with suppress(NoURLAvailableError):
+        internal_url = get_url(hass, allow_external=False)
+
+    # The URLs are the only properties that can be too long for zeroconf,
+    # the others are fixed or already truncated
     params = {
         "location_name": valid_location_name,
         "uuid": uuid,
         "version": __version__,
-        "external_url": "",
-        "internal_url": "",
-        # Old base URL, for backward compatibility
-        "base_url": "",
+        "external_url": _valid_property_value("external_url", external_url),
+        "internal_url": _valid_property_value("internal_url", internal_url),
+        # Old base URL, for backward compatibility, based on external or internal
+        "base_url": _valid_property_value("base_url", external_url or internal_url),
         # Always needs authentication
         "requires_api_password": True,
     }
 
-    # Get instance URL's
-    with suppress(NoURLAvailableError):
-        params["external_url"] = get_url(hass, allow_internal=False)
-
-    with suppress(NoURLAvailableError):
-        params["internal_url"] = get_url(hass, allow_external=False)
-
-    # Set old base URL based on external or internal
-    params["base_url"] = params["external_url"] or params["internal_url"]
-
     adapters = await network.async_get_adapters(hass)
 
     # Puts the default IPv4 address first in the list to preserve compatibility,
@@ -265,11 +372,9 @@ async def _async_register_hass_zc_service(
     host_ip = await async_get_source_ip(hass, target_ip=MDNS_TARGET_IP)
     host_ip_pton = None
     if host_ip:
-        host_ip_pton = socket.inet_pton(socket.AF_INET, host_ip)
+        host_ip_pton = _pack_address(socket.AF_INET, host_ip)
     address_list = _get_announced_addresses(adapters, host_ip_pton)
 
-    _suppress_invalid_properties(params)
-
     info = AsyncServiceInfo(
         ZEROCONF_TYPE,
         name=f"{valid_location_name}.{ZEROCONF_TYPE}",
@@ -298,20 +403,39 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
-        self.homekit_models = homekit_models
         self.ipv6 = ipv6
+        (
+            self._homekit_exact_models,
+            self._homekit_model_patterns,
+        ) = _partition_homekit_models(homekit_models)
+        self._matchers = {
+            service_type: _compile_matchers(matchers)
+            for service_type, matchers in zeroconf_types.items()
+        }
 
         self.async_service_browser: HaAsyncServiceBrowser | None = None
+        # Updates waiting to be processed, deduplicated by (service_type, name)
+        self._pending_updates: dict[tuple[str, str], None] = {}
+        self._process_pending_updates_handle: asyncio.Handle | None = None
+        # Batches being processed; not tracked by hass so they never hold up
+        # startup, but referenced here so they aren't garbage collected
+        self._process_tasks: set[asyncio.Task[None]] = set()
+        self._outstanding_updates = 0
+        self._service_update_semaphore = asyncio.Semaphore(
+            MAX_CONCURRENT_SERVICE_UPDATES
+        )
+        # When and with which payload each (service type, name, domain, source)
+        # was last dispatched, oldest first
+        self._recent_dispatches: OrderedDict[
+            tuple[str, str, str, str], tuple[float, tuple[Any, ...]]
+        ] = OrderedDict()
 
     async def async_setup(self) -> None:
         """Start discovery."""
-        types = list(self.zeroconf_types)
         # We want to make sure we know about other HomeAssistant
         # instances as soon as possible to avoid name conflicts
         # so we always browse for ZEROCONF_TYPE
-        for hk_type in (ZEROCONF_TYPE, *HOMEKIT_TYPES):
-            if hk_type not in self.zeroconf_types:
-                types.append(hk_type)
+        types = [*self.zeroconf_types, *(_EXTRA_TYPES - self.zeroconf_types.keys())]
         _LOGGER.debug("Starting Zeroconf browser for: %s", types)
         self.async_service_browser = HaAsyncServiceBrowser(
             self.ipv6, self.zeroconf, types, handlers=[self.async_service_update]
@@ -321,6 +445,12 @@ class ZeroconfDiscovery:
         """Cancel the service browser and stop processing the queue."""
         if self.async_service_browser:
             await self.async_service_browser.async_cancel()
+        if self._process_pending_updates_handle:
+            self._process_pending_updates_handle.cancel()
+            self._process_pending_updates_handle = None
+        for task in self._process_tasks:
+            task.cancel()
+        self._process_tasks.clear()
 
     @callback
     def async_service_update(
@@ -331,23 +461,72 @@ class ZeroconfDiscovery:
         state_change: ServiceStateChange,
     ) -> None:
         """Service state changed."""
-        _LOGGER.debug(
-            "service_update: type=%s name=%s state_change=%s",
-            service_type,
-            name,
-            state_change,
-        )
-
         if state_change == ServiceStateChange.Removed:
             return
 
-        asyncio.create_task(self._process_service_update(zeroconf, service_type, name))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "service_update: type=%s name=%s state_change=%s",
+                service_type,
+                name,
+                state_change,
+            )
+
+        # A single mDNS packet usually results in several updates, often for
+        # the same service. Collect them and process them together once the
+        # current batch of callbacks has run.
+        key = (service_type, name)
+        if key not in self._pending_updates:
+            if self._outstanding_updates >= MAX_OUTSTANDING_SERVICE_UPDATES:
+                _LOGGER.debug("Too many pending updates, dropping %s", name)
+                return
+            self._outstanding_updates += 1
+            self._pending_updates[key] = None
+        if self._process_pending_updates_handle is None:
+            self._process_pending_updates_handle = self.hass.loop.call_soon(
+                self._async_process_pending_updates
+            )
+
+    @callback
+    def _async_process_pending_updates(self) -> None:
+        """Process the updates that were collected since the last run."""
+        self._process_pending_updates_handle = None
+        pending_updates = self._pending_updates
+        self._pending_updates = {}
+        task = asyncio.create_task(
+            self._async_process_service_updates(list(pending_updates))
+        )
+        self._process_tasks.add(task)
+        task.add_done_callback(self._process_tasks.discard)
+
+    async def _async_process_service_updates(
+        self, updates: list[tuple[str, str]]
+    ) -> None:
+        """Process a batch of zeroconf updates concurrently."""
+        await asyncio.gather(
+            *(
+                self._process_service_update_limited(service_type, name)
+                for service_type, name in updates
+            )
+        )
+
+    async def _process_service_update_limited(
+        self, service_type: str, name: str
+    ) -> None:
+        """Process a zeroconf update once fewer updates are in progress."""
+        try:
+            async with self._service_update_semaphore:
+                await self._process_service_update(self.zeroconf, service_type, name)
+        finally:
+            self._outstanding_updates -= 1
 
     async def _process_service_update(
         self, zeroconf: HaZeroconf, service_type: str, name: str
     ) -> None:
         """Process a zeroconf update."""
         async_service_info = AsyncServiceInfo(service_type, name)
+        # Returns right away without any network traffic if the cache
+        # already has complete records for the service
         await async_service_info.async_request(zeroconf, 3000)
 
         info = info_from_service(async_service_info)
@@ -361,9 +540,11 @@ class ZeroconfDiscovery:
         # If we can handle it as a HomeKit discovery, we do that here.
         if service_type in HOMEKIT_TYPES:
             props = info[ATTR_PROPERTIES]
-            if domain := async_get_homekit_discovery_domain(self.homekit_models, props):
-                discovery_flow.async_create_flow(
-                    self.hass, domain, {"source": config_entries.SOURCE_HOMEKIT}, info
+            if domain := async_get_homekit_discovery_domain(
+                self._homekit_exact_models, self._homekit_model_patterns, props
+            ):
+                self._async_create_flow(
+                    service_type, name, domain, config_entries.SOURCE_HOMEKIT, info
                 )
             # Continue on here as homekit_controller
             # still needs to get updates on devices
@@ -382,100 +563,153 @@ class ZeroconfDiscovery:
                     # likely bad homekit data
                     return
 
-        if ATTR_NAME in info:
-            lowercase_name: str | None = info[ATTR_NAME].lower()
-        else:
-            lowercase_name = None
+        # Not all homekit types are currently used for discovery
+        # so not all service type exist in zeroconf_types
+        if not (matchers := self._matchers.get(service_type)):
+            return
 
-        if "macaddress" in info[ATTR_PROPERTIES]:
-            uppercase_mac: str | None = info[ATTR_PROPERTIES]["macaddress"].upper()
-        else:
-            uppercase_mac = None
+        domains = matchers.domains
+        matched = _matching_matchers(matchers, info)
+        index = 0
+        while matched:
+            if matched & 1:
+                self._async_create_flow(
+                    service_type,
+                    name,
+                    domains[index],
+                    config_entries.SOURCE_ZEROCONF,
+                    info,
+                )
+            matched >>= 1
+            index += 1
 
-        if "manufacturer" in info[ATTR_PROPERTIES]:
-            lowercase_manufacturer: str | None = info[ATTR_PROPERTIES][
-                "manufacturer"
-            ].lower()
-        else:
-            lowercase_manufacturer = None
+    @callback
+    def _async_create_flow(
+        self,
+        service_type: str,
+        name: str,
+        domain: str,
+        source: str,
+        info: ZeroconfServiceInfo,
+    ) -> None:
+        """Create a discovery flow unless the same one was just dispatched."""
+        # The properties are copied as config flows may modify them; "_raw"
+        # holds the same values undecoded
+        payload = (
+            info[ATTR_HOST],
+            info[ATTR_PORT],
+            {
+                key: value
+                for key, value in info[ATTR_PROPERTIES].items()
+                if key != "_raw"
+            },
+        )
+        key = (service_type, name, domain, source)
+        now = time.monotonic()
+        recent_dispatches = self._recent_dispatches
+        if (last_dispatch := recent_dispatches.get(key)) is not None and (
+            now - last_dispatch[0] < DISPATCH_CACHE_TTL and last_dispatch[1] == payload
+        ):
+            return
 
-        if "model" in info[ATTR_PROPERTIES]:
-            lowercase_model: str | None = info[ATTR_PROPERTIES]["model"].lower()
-        else:
-            lowercase_model = None
+        recent_dispatches[key] = (now, payload)
+        recent_dispatches.move_to_end(key)
+        if len(recent_dispatches) > DISPATCH_CACHE_SIZE:
+            recent_dispatches.popitem(last=False)
+
+        discovery_flow.async_create_flow(self.hass, domain, {"source": source}, info)
+
+
+def _matching_matchers(matchers: _ZeroconfMatchers, info: ZeroconfServiceInfo) -> int:
+    """Return the bits of the matchers whose patterns all match the discovery info."""
+    matched = (1 << len(matchers.domains)) - 1
+    for field_patterns in matchers.fields:
+        # Matchers without a pattern for the field aren't restricted by it
+        allowed = matched & ~field_patterns.mask
+        if (value := _normalized_field(info, field_patterns.field)) is not None:
+            for pattern, mask in field_patterns.patterns:
+                if mask & matched and pattern.match(value):
+                    allowed |= mask
+        matched &= allowed
+        # Fields are only normalized while some matcher can still match
+        if not matched:
+            break
+    return matched
 
-        # Not all homekit types are currently used for discovery
-        # so not all service type exist in zeroconf_types
-        for matcher in self.zeroconf_types.get(service_type, []):
-            if len(matcher) > 1:
-                if "macaddress" in matcher and (
-                    uppercase_mac is None
-                    or not fnmatch.fnmatch(uppercase_mac, matcher["macaddress"])
-                ):
-                    continue
-                if "name" in matcher and (
-                    lowercase_name is None
-                    or not fnmatch.fnmatch(lowercase_name, matcher["name"])
-                ):
-                    continue
-                if "manufacturer" in matcher and (
-                    lowercase_manufacturer is None
-                    or not fnmatch.fnmatch(
-                        lowercase_manufacturer, matcher["manufacturer"]
-                    )
-                ):
-                    continue
-                if "model" in matcher and (
-                    lowercase_model is None
-                    or not fnmatch.fnmatch(lowercase_model, matcher["model"])
-                ):
-                    continue
-
-            discovery_flow.async_create_flow(
-                self.hass,
-                matcher["domain"],
-                {"source": config_entries.SOURCE_ZEROCONF},
-                info,
-            )
+
+def _normalized_field(info: ZeroconfServiceInfo, field: str) -> str | None:
+    """Return a field of the discovery info normalized for matching."""
+    if field == ATTR_NAME:
+        return info[ATTR_NAME].lower()
+    if (value := info[ATTR_PROPERTIES].get(field)) is None:
+        return None
+    if field == "macaddress":
+        return cast(str, value.upper())
+    return cast(str, value.lower())
+
+
+def _partition_homekit_models(
+    homekit_models: dict[str, str]
+) -> tuple[dict[str, str], list[tuple[re.Pattern[str], str]]]:
+    """Split the HomeKit models into exact models and compiled fnmatch patterns."""
+    exact_models: dict[str, str] = {}
+    model_patterns: list[tuple[re.Pattern[str], str]] = []
+    for test_model, domain in homekit_models.items():
+        if any(char in test_model for char in "*?["):
+            model_patterns.append((re.compile(fnmatch.translate(test_model)), domain))
+        else:
+            exact_models[test_model] = domain
+    return exact_models, model_patterns
 
 
 def async_get_homekit_discovery_domain(
-    homekit_models: dict[str, str], props: dict[str, Any]
+    homekit_exact_models: dict[str, str],
+    homekit_model_patterns: list[tuple[re.Pattern[str], str]],
+    props: dict[str, Any],
 ) -> str | None:
     """Handle a HomeKit discovery.
 
     Return the domain to forward the discovery data to
     """
-    model = None
-    for key in props:
-        if key.lower() == HOMEKIT_MODEL:
-            model = props[key]
-            break
+    if (model := props.get(HOMEKIT_MODEL)) is None and (
+        model := props.get(HOMEKIT_MODEL.upper())
+    ) is None:
+        for key in props:
+            if key.lower() == HOMEKIT_MODEL:
+                model = props[key]
+                break
+        else:
+            return None
 
-    if model is None:
-        return None
+    if domain := homekit_exact_models.get(model):
+        return domain
 
-    for test_model in homekit_models:
-        if (
-            model != test_model
-            and not model.startswith((f"{test_model} ", f"{test_model}-"))
-            and not fnmatch.fnmatch(model, test_model)
-        ):
-            continue
+    # A known model followed by a space or dash and a suffix, most specific first
+    for idx in range(len(model) - 1, 0, -1):
+        if model[idx] in " -" and (domain := homekit_exact_models.get(model[:idx])):
+            return domain
 
-        return homekit_models[test_model]
+    for pattern, domain in homekit_model_patterns:
+        if pattern.match(model):
+            return domain
 
     return None
 
 
 def info_from_service(service: AsyncServiceInfo) -> ZeroconfServiceInfo | None:
     """Return prepared info from mDNS entries."""
-    properties: dict[str, Any] = {"_raw": {}}
+    if not (addresses := service.addresses):
+        return None
+    if (host := _first_non_link_local_or_v6_address(addresses)) is None:
+        return None
 
+    raw: dict[str, Any] = {}
+    properties: dict[str, Any] = {"_raw": raw}
     for key, value in service.properties.items():
         # See https://ietf.org/rfc/rfc6763.html#section-6.4 and
         # https://ietf.org/rfc/rfc6763.html#section-6.5 for expected encodings
         # for property keys and values
+        # Keys are decoded directly, looking them up in a cache is slower
         try:
             key = key.decode("ascii")
         except UnicodeDecodeError:
@@ -484,19 +718,14 @@ def info_from_service(service: AsyncServiceInfo) -> ZeroconfServiceInfo | None:
             )
             continue
 
-        properties["_raw"][key] = value
+        raw[key] = value
 
-        with suppress(UnicodeDecodeError):
-            if isinstance(value, bytes):
+        if isinstance(value, bytes):
+            with suppress(UnicodeDecodeError):
                 properties[key] = value.decode("utf-8")
 
-    if not (addresses := service.addresses):
-        return None
-    if (host := _first_non_link_local_or_v6_address(addresses)) is None:
-        return None
-
     return ZeroconfServiceInfo(
-        host=str(host),
+        host=host,
         port=service.port,
         hostname=service.server,
         type=service.type,
@@ -508,32 +737,40 @@ def info_from_service(service: AsyncServiceInfo) -> ZeroconfServiceInfo | None:
 def _first_non_link_local_or_v6_address(addresses: list[bytes]) -> str | None:
     """Return the first ipv6 or non-link local ipv4 address."""
     for address in addresses:
-        ip_addr = ip_address(address)
-        if not ip_addr.is_link_local or ip_addr.version == 6:
-            return str(ip_addr)
+        if len(address) == 16:
+            return socket.inet_ntop(socket.AF_INET6, address)
+        if not address.startswith(IPV4_LINK_LOCAL_PREFIX):
+            return socket.inet_ntop(socket.AF_INET, address)
     return None
 
 
-def _suppress_invalid_properties(properties: dict) -> None:
-    """Suppress any properties that will cause zeroconf to fail to startup."""
-
-    for prop, prop_value in properties.items():
-        if not isinstance(prop_value, str):
-            continue
-
-        if len(prop_value.encode("utf-8")) > MAX_PROPERTY_VALUE_LEN:
-            _LOGGER.error(
-                "The property '%s' was suppressed because it is longer than the maximum length of %d bytes: %s",
-                prop,
-                MAX_PROPERTY_VALUE_LEN,
-                prop_value,
-            )
-            properties[prop] = ""
+def _valid_property_value(prop: str, prop_value: str) -> str:
+    """Return the property value, or suppress it if it will cause zeroconf to fail to startup."""
+    # A character takes 1 to 4 bytes in UTF-8, so only encode when the
+    # length in characters doesn't already decide it
+    length = len(prop_value)
+    if length * 4 <= MAX_PROPERTY_VALUE_LEN or (
+        length <= MAX_PROPERTY_VALUE_LEN
+        and len(prop_value.encode("utf-8")) <= MAX_PROPERTY_VALUE_LEN
+    ):
+        return prop_value
+
+    _LOGGER.error(
+        "The property '%s' was suppressed because it is longer than the maximum length of %d bytes: %s",
+        prop,
+        MAX_PROPERTY_VALUE_LEN,
+        prop_value,
+    )
+    return ""
 
 
 def _truncate_location_name_to_valid(location_name: str) -> str:
     """Truncate or return the location name usable for zeroconf."""
-    if len(location_name.encode("utf-8")) < MAX_NAME_LEN:
+    # A character takes 1 to 4 bytes in UTF-8
+    length = len(location_name)
+    if length * 4 < MAX_NAME_LEN or (
+        length < MAX_NAME_LEN and len(location_name.encode("utf-8")) < MAX_NAME_LEN
+    ):
         return location_name
 
     _LOGGER.warning(
@@ -1,11 +1,50 @@
 """Tests for the Velbus component initialisation."""
+from unittest.mock import MagicMock, patch
+
 import pytest
+from velbusaio.controller import Velbus
+import voluptuous as vol
 
-from homeassistant.components.velbus.const import DOMAIN
+from homeassistant.components.velbus.const import (
+    CONF_INTERFACE,
+    DOMAIN,
+    SERVICE_SCAN,
+    SERVICE_SET_MEMO_TEXT,
+    SERVICE_SYNC,
+)
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_NAME, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry, mock_device_registry
+from tests.components.velbus.const import PORT_SERIAL, PORT_TCP
+
+
+@pytest.fixture(name="controllers")
+def mock_controllers():
+    """Mock a separate velbus controller for each port."""
+    controllers = {}
 
-from tests.common import mock_device_registry
+    def _create_controller(port, **kwargs):
+        controllers[port] = MagicMock(spec=Velbus)
+        return controllers[port]
+
+    with patch(
+        "homeassistant.components.velbus.Velbus", side_effect=_create_controller
+    ):
+        yield controllers
+
+
+@pytest.fixture(name="serial_config_entry")
+def mock_serial_config_entry(hass: HomeAssistant) -> ConfigEntry:
+    """Create and register a second mock config entry on a serial port."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_PORT: PORT_SERIAL, CONF_NAME: "velbus garage"},
+    )
+    config_entry.add_to_hass(hass)
+    return config_entry
 
 
 @pytest.mark.usefixtures("controller")
@@ -54,3 +93,104 @@ async def test_device_identifier_migration(
     assert device_entry.manufacturer == "Velleman"
     assert device_entry.model == "module_type_name"
     assert device_entry.sw_version == "module_sw_version"
+
+
+@pytest.mark.usefixtures("config_entry", "serial_config_entry")
+async def test_services_use_controller_of_interface(
+    hass: HomeAssistant, controllers: dict[str, MagicMock]
+):
+    """Test the services are handled by the controller of the given interface."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SCAN, {CONF_INTERFACE: PORT_TCP}, blocking=True
+    )
+    controllers[PORT_TCP].scan.assert_awaited_once()
+    controllers[PORT_SERIAL].scan.assert_not_awaited()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SYNC, {CONF_INTERFACE: PORT_SERIAL}, blocking=True
+    )
+    controllers[PORT_SERIAL].sync_clock.assert_awaited_once()
+    controllers[PORT_TCP].sync_clock.assert_not_awaited()
+
+
+@pytest.mark.usefixtures("controllers", "config_entry")
+async def test_service_unknown_interface(hass: HomeAssistant):
+    """Test calling a service with an interface that isn't configured."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SCAN, {CONF_INTERFACE: "/dev/ttyUnknown"}, blocking=True
+        )
+
+
+@pytest.mark.usefixtures("serial_config_entry")
+async def test_unload_one_of_two_entries(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    controllers: dict[str, MagicMock],
+):
+    """Test unloading one entry keeps the services working for the other."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    controllers[PORT_TCP].stop.assert_awaited_once()
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SCAN, {CONF_INTERFACE: PORT_TCP}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SCAN, {CONF_INTERFACE: PORT_SERIAL}, blocking=True
+    )
+    controllers[PORT_SERIAL].scan.assert_awaited_once()
+
+
+@pytest.mark.usefixtures("controllers")
+async def test_unload_last_entry_removes_services(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    serial_config_entry: ConfigEntry,
+):
+    """Test the services are removed once the last entry is unloaded."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.services.has_service(DOMAIN, SERVICE_SCAN)
+
+    assert await hass.config_entries.async_unload(serial_config_entry.entry_id)
+    await hass.async_block_till_done()
+    for service in (SERVICE_SCAN, SERVICE_SYNC, SERVICE_SET_MEMO_TEXT):
+        assert not hass.services.has_service(DOMAIN, service)
+    assert DOMAIN not in hass.data
+
+
+async def test_reload_entry_registers_services(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    controllers: dict[str, MagicMock],
+):
+    """Test the services are registered again when an entry is reloaded."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    for service in (SERVICE_SCAN, SERVICE_SYNC, SERVICE_SET_MEMO_TEXT):
+        assert hass.services.has_service(DOMAIN, service)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SCAN, {CONF_INTERFACE: PORT_TCP}, blocking=True
+    )
+    controllers[PORT_TCP].scan.assert_awaited_once()
@@ -1,4 +1,5 @@
 """Test Zeroconf component setup process."""
+import asyncio
 from ipaddress import ip_address
 from typing import Any
 from unittest.mock import call, patch
@@ -775,6 +776,301 @@ async def test_removed_ignored(hass, mock_async_zeroconf):
     assert mock_service_info.mock_calls[1][1][0] == "_service.updated.local."
 
 
+async def async_wait_for_service_updates(hass, handler):
+    """Wait until the service updates seen by the handler's discovery are processed."""
+    discovery = handler.__self__
+    await hass.async_block_till_done()
+    while discovery._process_tasks:
+        await asyncio.gather(*discovery._process_tasks)
+    await hass.async_block_till_done()
+
+
+async def test_service_updates_coalesced(hass, mock_async_zeroconf):
+    """Test updates for the same service in one loop iteration are processed once."""
+
+    captured_handlers = []
+
+    def service_update_mock(ipv6, zeroconf, services, handlers):
+        """Call service update handler."""
+        captured_handlers.extend(handlers)
+        for state_change in (
+            ServiceStateChange.Added,
+            ServiceStateChange.Updated,
+            ServiceStateChange.Updated,
+        ):
+            handlers[0](
+                zeroconf,
+                "_service.first.local.",
+                "name._service.first.local.",
+                state_change,
+            )
+        handlers[0](
+            zeroconf,
+            "_service.second.local.",
+            "name._service.second.local.",
+            ServiceStateChange.Added,
+        )
+
+    with patch.object(
+        zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_service_info_mock,
+    ) as mock_service_info:
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await async_wait_for_service_updates(hass, captured_handlers[0])
+
+    assert len(mock_service_info.mock_calls) == 2
+    assert mock_service_info.mock_calls[0][1][0] == "_service.first.local."
+    assert mock_service_info.mock_calls[1][1][0] == "_service.second.local."
+
+
+async def test_service_update_concurrency_limited(hass, mock_async_zeroconf):
+    """Test only a limited number of service updates are processed at a time."""
+    in_progress = 0
+    max_in_progress = 0
+    release = asyncio.Event()
+
+    class BlockingServiceInfo(AsyncServiceInfo):
+        """Service info whose request waits until released."""
+
+        async def async_request(self, zc, timeout, question_type=None):
+            nonlocal in_progress, max_in_progress
+            in_progress += 1
+            max_in_progress = max(max_in_progress, in_progress)
+            await release.wait()
+            in_progress -= 1
+            return True
+
+    captured_handlers = []
+
+    def service_update_mock(ipv6, zeroconf, services, handlers):
+        """Call service update handler."""
+        captured_handlers.extend(handlers)
+        for index in range(5):
+            handlers[0](
+                zeroconf,
+                f"_service{index}.local.",
+                f"name._service{index}.local.",
+                ServiceStateChange.Added,
+            )
+
+    def get_blocking_service_info_mock(service_type, name):
+        return BlockingServiceInfo(
+            service_type,
+            name,
+            addresses=[b"\n\x00\x00\x14"],
+            port=80,
+            weight=0,
+            priority=0,
+            server="name.local.",
+            properties=PROPERTIES,
+        )
+
+    with patch.object(zeroconf, "MAX_CONCURRENT_SERVICE_UPDATES", 2), patch.object(
+        zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_blocking_service_info_mock,
+    ) as mock_service_info:
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert len(mock_service_info.mock_calls) == 2
+        assert in_progress == 2
+
+        release.set()
+        await async_wait_for_service_updates(hass, captured_handlers[0])
+
+    assert len(mock_service_info.mock_calls) == 5
+    assert in_progress == 0
+    assert max_in_progress == 2
+
+
+async def test_service_updates_dropped_when_too_many_outstanding(
+    hass, mock_async_zeroconf, caplog
+):
+    """Test service updates are dropped while too many are outstanding."""
+    captured_handlers = []
+
+    def service_update_mock(ipv6, zeroconf, services, handlers):
+        """Call service update handler for more services than allowed."""
+        captured_handlers.extend(handlers)
+        for index in range(3):
+            handlers[0](
+                zeroconf,
+                f"_service{index}.local.",
+                f"name._service{index}.local.",
+                ServiceStateChange.Added,
+            )
+
+    with patch.object(zeroconf, "MAX_OUTSTANDING_SERVICE_UPDATES", 2), patch.object(
+        zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_service_info_mock,
+    ) as mock_service_info:
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        await async_wait_for_service_updates(hass, captured_handlers[0])
+
+        assert len(mock_service_info.mock_calls) == 2
+        assert "Too many pending updates, dropping name._service2.local." in caplog.text
+
+        # Processed updates no longer count as outstanding
+        captured_handlers[0](
+            None,
+            "_service2.local.",
+            "name._service2.local.",
+            ServiceStateChange.Added,
+        )
+        await async_wait_for_service_updates(hass, captured_handlers[0])
+
+    assert len(mock_service_info.mock_calls) == 3
+    assert mock_service_info.mock_calls[2][1][0] == "_service2.local."
+
+
+def capture_service_update_handler(captured_handlers):
+    """Return a service browser mock that captures the service update handler."""
+
+    def service_browser_mock(ipv6, zeroconf, services, handlers):
+        captured_handlers.extend(handlers)
+
+    return service_browser_mock
+
+
+def get_changing_service_info_mock(discovered):
+    """Return service info built from the currently discovered address and properties."""
+
+    def mock_service_info(service_type, name):
+        return AsyncServiceInfo(
+            service_type,
+            name,
+            addresses=[discovered["address"]],
+            port=80,
+            weight=0,
+            priority=0,
+            server="name.local.",
+            properties=discovered["properties"],
+        )
+
+    return mock_service_info
+
+
+async def test_repeated_discovery_dispatched_once(hass, mock_async_zeroconf):
+    """Test an unchanged service announced again does not start another flow."""
+    handlers = []
+    discovered = {
+        "address": b"\n\x00\x00\x14",
+        "properties": {b"macaddress": b"ABCDEF012345"},
+    }
+
+    async def _async_announce():
+        handlers[0](
+            None,
+            "_http._tcp.local.",
+            "_name._http._tcp.local.",
+            ServiceStateChange.Updated,
+        )
+        await async_wait_for_service_updates(hass, handlers[0])
+
+    with patch.dict(
+        zc_gen.ZEROCONF,
+        {"_http._tcp.local.": [{"domain": "shelly"}]},
+        clear=True,
+    ), patch.object(
+        hass.config_entries.flow, "async_init"
+    ) as mock_config_flow, patch.object(
+        zeroconf,
+        "HaAsyncServiceBrowser",
+        side_effect=capture_service_update_handler(handlers),
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_changing_service_info_mock(discovered),
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        await _async_announce()
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 1
+        assert mock_config_flow.mock_calls[0][1][0] == "shelly"
+        assert mock_config_flow.mock_calls[0][2]["data"]["properties"] == {
+            "_raw": {"macaddress": b"ABCDEF012345"},
+            "macaddress": "ABCDEF012345",
+        }
+
+        # Changed properties are dispatched again
+        discovered["properties"] = {b"macaddress": b"ABCDEF012345", b"id": b"1"}
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 2
+        assert mock_config_flow.mock_calls[1][2]["data"]["properties"]["id"] == "1"
+
+        # So is a changed host
+        discovered["address"] = b"\n\x00\x00\x15"
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 3
+        assert mock_config_flow.mock_calls[2][2]["data"]["host"] == "10.0.0.21"
+
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 3
+
+
+async def test_repeated_homekit_discovery_dispatched_once(hass, mock_async_zeroconf):
+    """Test HomeKit discoveries are only dispatched again when they change."""
+    handlers = []
+    discovered = {
+        "address": b"\n\x00\x00\x14",
+        "properties": {
+            b"md": b"LIFX bulb",
+            b"sf": HOMEKIT_STATUS_UNPAIRED,
+            b"c#": b"1",
+        },
+    }
+
+    async def _async_announce():
+        handlers[0](
+            None,
+            "_hap._tcp.local.",
+            "_name._hap._tcp.local.",
+            ServiceStateChange.Updated,
+        )
+        await async_wait_for_service_updates(hass, handlers[0])
+
+    with patch.dict(zc_gen.ZEROCONF, {}, clear=True), patch.object(
+        hass.config_entries.flow, "async_init"
+    ) as mock_config_flow, patch.object(
+        zeroconf,
+        "HaAsyncServiceBrowser",
+        side_effect=capture_service_update_handler(handlers),
+    ), patch(
+        "homeassistant.components.zeroconf.AsyncServiceInfo",
+        side_effect=get_changing_service_info_mock(discovered),
+    ):
+        assert await async_setup_component(hass, zeroconf.DOMAIN, {zeroconf.DOMAIN: {}})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+        await _async_announce()
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 1
+        assert mock_config_flow.mock_calls[0][1][0] == "lifx"
+        assert mock_config_flow.mock_calls[0][2]["context"] == {"source": "homekit"}
+
+        # A configuration number bump is dispatched again
+        discovered["properties"] = {
+            b"md": b"LIFX bulb",
+            b"sf": HOMEKIT_STATUS_UNPAIRED,
+            b"c#": b"2",
+        }
+        await _async_announce()
+        assert len(mock_config_flow.mock_calls) == 2
+        assert mock_config_flow.mock_calls[1][1][0] == "lifx"
+        assert mock_config_flow.mock_calls[1][2]["data"]["properties"]["c#"] == "2"
+
+
 _ADAPTER_WITH_DEFAULT_ENABLED = [
     {
         "auto": True,
@@ -875,7 +1171,7 @@ async def test_async_detect_interfaces_setting_empty_route_linux(
     hass, mock_async_zeroconf
 ):
     """Test without default interface config and the route returns nothing on linux."""
-    with patch("homeassistant.components.zeroconf.sys.platform", "linux"), patch(
+    with patch("homeassistant.components.zeroconf._HAS_DUAL_STACK", True), patch(
         "homeassistant.components.zeroconf.HaZeroconf"
     ) as mock_zc, patch.object(hass.config_entries.flow, "async_init"), patch.object(
         zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
@@ -905,7 +1201,7 @@ async def test_async_detect_interfaces_setting_empty_route_freebsd(
     hass, mock_async_zeroconf
 ):
     """Test without default interface config and the route returns nothing on freebsd."""
-    with patch("homeassistant.components.zeroconf.sys.platform", "freebsd"), patch(
+    with patch("homeassistant.components.zeroconf._HAS_DUAL_STACK", False), patch(
         "homeassistant.components.zeroconf.HaZeroconf"
     ) as mock_zc, patch.object(hass.config_entries.flow, "async_init"), patch.object(
         zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
@@ -973,7 +1269,7 @@ async def test_async_detect_interfaces_explicitly_set_ipv6_linux(
     hass, mock_async_zeroconf
 ):
     """Test interfaces are explicitly set when IPv6 is present on linux."""
-    with patch("homeassistant.components.zeroconf.sys.platform", "linux"), patch(
+    with patch("homeassistant.components.zeroconf._HAS_DUAL_STACK", True), patch(
         "homeassistant.components.zeroconf.HaZeroconf"
     ) as mock_zc, patch.object(hass.config_entries.flow, "async_init"), patch.object(
         zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock
@@ -998,7 +1294,7 @@ async def test_async_detect_interfaces_explicitly_set_ipv6_freebsd(
     hass, mock_async_zeroconf
 ):
     """Test interfaces are explicitly set when IPv6 is present on freebsd."""
-    with patch("homeassistant.components.zeroconf.sys.platform", "freebsd"), patch(
+    with patch("homeassistant.components.zeroconf._HAS_DUAL_STACK", False), patch(
         "homeassistant.components.zeroconf.HaZeroconf"
     ) as mock_zc, patch.object(hass.config_entries.flow, "async_init"), patch.object(
         zeroconf, "HaAsyncServiceBrowser", side_effect=service_update_mock